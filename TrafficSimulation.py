@@ -6,90 +6,137 @@ import tkinter as tk
 from tkinter import messagebox
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
+import multiprocessing
 import os
 
-# Initialize Pygame
-pygame.init()
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; run the kernels as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Traffic Simulation")
+screen = None
+
+
+def _init_display():
+    """Create the pygame window on demand; headless batch workers skip it."""
+    global screen
+    if screen is None:
+        pygame.init()
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Traffic Simulation")
 
 
 class Road:
-    def __init__(self, name, capacity, coordinates=None):
+    def __init__(self, name, capacity, coordinates=None, time_window=24):
         self.name = name
         self.capacity = capacity
         self.current_load = 0
         self.coordinates = coordinates
-        self.history = []
+        # One congestion sample per hour, preallocated; t is the write cursor
+        # and history[:t] is the valid prefix.
+        self.history = np.zeros(time_window, np.float32)
+        self.t = 0
+
+    def record(self, congestion):
+        self.history[self.t] = congestion
+        self.t += 1
+
+
+VEHICLE_COLORS = ((255, 0, 0), (0, 128, 255))  # 0 = low priority, 1 = high priority
 
 
 class Vehicle:
-    def __init__(self, id, weight, priority, speed=5):
+    """Thin view onto one row of the simulator's fleet arrays (SoA layout)."""
+
+    __slots__ = ("sim", "id")
+
+    def __init__(self, sim, id):
+        self.sim = sim
         self.id = id
-        self.weight = weight
-        self.priority = priority
-        self.x = np.random.randint(100, SCREEN_WIDTH - 100)
-        self.y = 300 if id % 2 == 0 else 400  # Alternate between lanes
-        self.color = (0, 128, 255) if priority > 2 else (255, 0, 0)
-        self.speed = speed
 
-    def move(self, congestion_level):
-        """Move vehicle and adjust speed based on congestion level."""
-        self.speed = max(1, int(5 * (1 - congestion_level)))  # Slow down in congestion
-        self.x += self.speed
-        if self.x > SCREEN_WIDTH:
-            self.x = 0  # Loop back to the start of the road
+    @property
+    def weight(self):
+        return int(self.sim.vweight[self.id])
+
+    @property
+    def priority(self):
+        return int(self.sim.vpriority[self.id])
+
+    @property
+    def x(self):
+        return int(self.sim.vx[self.id])
+
+    @property
+    def y(self):
+        return int(self.sim.vy[self.id])
+
+    @property
+    def color(self):
+        return VEHICLE_COLORS[self.sim.vcolor[self.id]]
+
+    @property
+    def speed(self):
+        return int(self.sim.vspeed[self.id])
 
 
 class TrafficLight:
+    # States are ints (0=green, 1=yellow, 2=red); each entry is the next
+    # state and the frame count that triggers the transition, so update is a
+    # table lookup instead of a chain of string comparisons.
+    TRANSITIONS = ((1, 60), (2, 10), (0, 60))
+    COLORS = ((0, 255, 0), (255, 255, 0), (255, 0, 0))
+
     def __init__(self, position):
         self.position = position
-        self.state = 'green'
+        self.state = 0
         self.timer = 0
 
     def update(self):
         """Update traffic light state based on timer."""
         self.timer += 1
-        if self.state == 'green' and self.timer > 60:
-            self.state = 'yellow'
-            self.timer = 0
-        elif self.state == 'yellow' and self.timer > 10:
-            self.state = 'red'
-            self.timer = 0
-        elif self.state == 'red' and self.timer > 60:
-            self.state = 'green'
+        next_state, threshold = self.TRANSITIONS[self.state]
+        if self.timer > threshold:
+            self.state = next_state
             self.timer = 0
 
     def draw(self, screen):
         """Draw traffic light on screen."""
-        color = (0, 255, 0) if self.state == 'green' else (255, 255, 0) if self.state == 'yellow' else (255, 0, 0)
-        pygame.draw.circle(screen, color, self.position, 10)
-
-
-def optimize_traffic_flow(roads, vehicles):
-    assignments = {}
-    for vehicle in vehicles:
-        best_road = min(roads, key=lambda r: r.current_load / r.capacity)
-        assignments[vehicle.id] = best_road.name
-        best_road.current_load += vehicle.weight
-    return assignments
-
-
-def balance_traffic_flow(roads, vehicles):
-    assignments = {}
-    roads_sorted = sorted(roads, key=lambda road: road.current_load / road.capacity)
-    for vehicle in vehicles:
-        for road in roads_sorted:
-            if road.current_load + vehicle.weight <= road.capacity:
-                assignments[vehicle.id] = road.name
-                road.current_load += vehicle.weight
-                break
-    return assignments
+        pygame.draw.circle(screen, self.COLORS[self.state], self.position, 10)
+
+
+@njit(cache=True)
+def assign_batch(weights, loads, caps, balanced):
+    """Assign each vehicle weight to the least-loaded road by load/capacity,
+    mutating loads in place and returning the chosen road index per vehicle.
+
+    With balanced=True a road the vehicle would push over capacity is skipped
+    (the Balanced Traffic Approach); -1 marks vehicles no road could take.
+    Compiled with Numba when available so the innermost scan runs as native
+    code instead of interpreter dispatch."""
+    n = weights.shape[0]
+    out = np.full(n, -1, np.int64)
+    for k in range(n):
+        best = -1
+        best_ratio = np.inf
+        for i in range(loads.shape[0]):
+            if balanced and loads[i] + weights[k] > caps[i]:
+                continue
+            ratio = loads[i] / caps[i]
+            if ratio < best_ratio:
+                best_ratio = ratio
+                best = i
+        if best >= 0:
+            loads[best] += weights[k]
+            out[k] = best
+    return out
 
 
 class TrafficSimulator:
-    def __init__(self, env, roads, time_window=24, method="1", peak_hours=(8, 10), vehicle_rate=20):
+    def __init__(self, env, roads, time_window=24, method="1", peak_hours=(8, 10), vehicle_rate=20, seed=None):
         self.env = env
         self.roads = roads
         self.time_window = time_window
@@ -97,87 +144,169 @@ class TrafficSimulator:
         self.method = method
         self.peak_hours = peak_hours
         self.vehicle_rate = vehicle_rate
-
-    def add_vehicle(self, vehicle):
-        self.vehicles.append(vehicle)
-        self.env.process(self.vehicle_process(vehicle))
-
-    def vehicle_process(self, vehicle):
-        if self.method == "1":
-            assignments = optimize_traffic_flow(self.roads, [vehicle])
-        else:
-            assignments = balance_traffic_flow(self.roads, [vehicle])
-
-        road_name = assignments[vehicle.id]
-        assigned_road = next(road for road in self.roads if road.name == road_name)
-        assigned_road.current_load += vehicle.weight
-        yield self.env.timeout(1)
-        assigned_road.current_load = max(0, assigned_road.current_load - vehicle.weight)
-        assigned_road.history.append(assigned_road.current_load / assigned_road.capacity)
+        self.rng = np.random.default_rng(seed)
+        self._caps = np.array([road.capacity for road in roads], np.int64)
+        # Per-hour arrival rates are fixed by the parameters, so build the
+        # vector once: full rate during peak hours, half rate otherwise.
+        hours = np.arange(time_window)
+        is_peak = (hours >= peak_hours[0]) & (hours <= peak_hours[1])
+        self.rates = np.where(is_peak, vehicle_rate, vehicle_rate // 2)
+        self.total_ratio = 0.0  # Sum of load/capacity over roads, refreshed each tick
+        self.fig = None  # Summary figure, built lazily and reused across refreshes
+        # Fleet state lives in parallel arrays (structure-of-arrays); Vehicle
+        # objects are just indexed views into these buffers.
+        capacity = 256
+        self.vx = np.empty(capacity, np.int32)
+        self.vy = np.empty(capacity, np.int32)
+        self.vweight = np.empty(capacity, np.int8)
+        self.vpriority = np.empty(capacity, np.int8)
+        self.vspeed = np.empty(capacity, np.int32)
+        self.vcolor = np.empty(capacity, np.uint8)
+
+    def _grow_fleet(self):
+        for name in ("vx", "vy", "vweight", "vpriority", "vspeed", "vcolor"):
+            old = getattr(self, name)
+            setattr(self, name, np.concatenate([old, np.empty_like(old)]))
+
+    def add_vehicle(self, weight, priority, x):
+        i = len(self.vehicles)
+        if i >= len(self.vx):
+            self._grow_fleet()
+        self.vx[i] = x
+        self.vy[i] = 300 if i % 2 == 0 else 400  # Alternate between lanes
+        self.vweight[i] = weight
+        self.vpriority[i] = priority
+        self.vspeed[i] = 5
+        self.vcolor[i] = 1 if priority > 2 else 0
+        self.vehicles.append(Vehicle(self, i))
 
     def generate_random_traffic(self):
+        # Draw everything up front in a handful of batched NumPy calls instead
+        # of one Python-level call per vehicle.
+        counts = self.rng.poisson(self.rates)
+        total = int(counts.sum())
+        weights = self.rng.integers(1, 4, total)
+        priorities = self.rng.integers(1, 6, total)
+        xs = self.rng.integers(100, SCREEN_WIDTH - 100, total)
+
+        offset = 0
+        balanced = self.method != "1"
+        num_roads = len(self.roads)
+        departing = np.zeros(num_roads, np.int64)  # Weight leaving each road next hour
         for hour in range(self.time_window):
-            is_peak = self.peak_hours[0] <= hour <= self.peak_hours[1]
-            rate = self.vehicle_rate if is_peak else int(self.vehicle_rate / 2)
-            num_vehicles = np.random.poisson(rate)
-            for _ in range(num_vehicles):
-                vehicle = Vehicle(id=len(self.vehicles), weight=np.random.choice([1, 2, 3]),
-                                  priority=np.random.choice([1, 2, 3, 4, 5]))
-                self.add_vehicle(vehicle)
+            count = int(counts[hour])
+            hour_weights = weights[offset:offset + count]
+            # One tick per hour instead of a SimPy process per vehicle: clear
+            # last hour's departures, assign the new batch in one compiled
+            # scan, and record one history sample per road.
+            loads = np.array([road.current_load for road in self.roads], np.int64)
+            loads = np.maximum(0, loads - departing)
+            road_idx = assign_batch(hour_weights, loads, self._caps, balanced)
+            placed = road_idx >= 0
+            departing = np.bincount(road_idx[placed], weights=hour_weights[placed],
+                                    minlength=num_roads).astype(np.int64)
+            self.total_ratio = float((loads / self._caps).sum())
+            for road, load in zip(self.roads, loads.tolist()):
+                road.current_load = load
+                road.record(load / road.capacity)
+            for i in range(offset, offset + count):
+                self.add_vehicle(int(weights[i]), int(priorities[i]), int(xs[i]))
+            offset += count
             yield self.env.timeout(1)
 
-    def run_matplotlib_visualization(self):
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
+    def _build_figure(self):
+        """Create the summary figure and its Line2D artists once.
 
-        # Congestion Levels Over Time with Annotations
+        Refreshes only push new data into the existing artists via set_data,
+        so repeated calls (e.g. a live view) do not rebuild four subplots."""
+        self.fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
+        self.axes = (ax1, ax2, ax3, ax4)
+        self.congestion_lines = {}
+        self.count_lines = {}
         for road in self.roads:
-            ax1.plot(road.history, label=f'{road.name} Congestion Level')
-            for i, value in enumerate(road.history):
-                if i % 20 == 0:  # Annotate every 20th point for clarity
-                    ax1.annotate(f"{value * 100:.2f}%", (i, value), textcoords="offset points", xytext=(0, 5),
-                                 ha='center')
+            self.congestion_lines[road.name] = ax1.plot([], [], label=f'{road.name} Congestion Level')[0]
+            self.count_lines[road.name] = ax2.plot([], [], label=f'{road.name} Vehicle Count')[0]
+        self.throughput_line = ax3.plot([], [], color="blue")[0]
+        self.annotations = []
+
         ax1.set_title("Congestion Levels Over Time")
         ax1.set_xlabel("Time (units)")
         ax1.set_ylabel("Congestion Level (%)")
         ax1.legend()
         ax1.grid(True)
 
-        # Vehicle Counts Over Time with Annotations
-        for road in self.roads:
-            vehicle_counts = [load * road.capacity for load in road.history]
-            ax2.plot(vehicle_counts, label=f'{road.name} Vehicle Count')
-            for i, value in enumerate(vehicle_counts):
-                if i % 20 == 0:  # Annotate every 20th point
-                    ax2.annotate(f"{int(value)}", (i, value), textcoords="offset points", xytext=(0, 5), ha='center')
         ax2.set_title("Vehicle Counts Over Time")
         ax2.set_xlabel("Time (units)")
         ax2.set_ylabel("Number of Vehicles")
         ax2.legend()
         ax2.grid(True)
 
-        # System Throughput with Annotations
-        total_throughput = [sum(road.current_load for road in self.roads) for _ in range(len(self.roads[0].history))]
-        ax3.plot(total_throughput, color="blue")
-        for i, value in enumerate(total_throughput):
-            if i % 20 == 0:  # Annotate every 20th point
-                ax3.annotate(f"{int(value)}", (i, value), textcoords="offset points", xytext=(0, 5), ha='center')
         ax3.set_title("System Throughput")
         ax3.set_xlabel("Time (units)")
         ax3.set_ylabel("Total Vehicles in System")
         ax3.grid(True)
 
+    def run_matplotlib_visualization(self):
+        if self.fig is None:
+            self._build_figure()
+        ax1, ax2, ax3, ax4 = self.axes
+
+        # Annotations and bars depend on the data, so they are rebuilt; the
+        # lines themselves just get new data pushed into them.
+        for artist in self.annotations:
+            artist.remove()
+        self.annotations = []
+
+        # Histories are already float32 arrays; take each valid prefix once and
+        # slice the annotation points instead of testing i % 20 on every sample.
+        histories = {road.name: road.history[:road.t] for road in self.roads}
+
+        # Congestion Levels Over Time with Annotations
+        for road in self.roads:
+            h = histories[road.name]
+            self.congestion_lines[road.name].set_data(np.arange(len(h)), h)
+            idx = np.arange(0, len(h), 20)  # Annotate every 20th point for clarity
+            for i, value in zip(idx.tolist(), h[idx].tolist()):
+                self.annotations.append(
+                    ax1.annotate(f"{value * 100:.2f}%", (i, value), textcoords="offset points", xytext=(0, 5),
+                                 ha='center'))
+
+        # Vehicle Counts Over Time with Annotations
+        for road in self.roads:
+            vehicle_counts = histories[road.name] * road.capacity
+            self.count_lines[road.name].set_data(np.arange(len(vehicle_counts)), vehicle_counts)
+            idx = np.arange(0, len(vehicle_counts), 20)  # Annotate every 20th point
+            for i, value in zip(idx.tolist(), vehicle_counts[idx].tolist()):
+                self.annotations.append(
+                    ax2.annotate(f"{int(value)}", (i, value), textcoords="offset points", xytext=(0, 5), ha='center'))
+
+        # System Throughput with Annotations
+        # Sum the per-time-step vehicle counts across roads; the old version
+        # repeated the final current_load sum T times and plotted a flat line.
+        span = min(len(h) for h in histories.values())
+        total_throughput = np.sum([histories[road.name][:span] * road.capacity for road in self.roads], axis=0)
+        self.throughput_line.set_data(np.arange(span), total_throughput)
+        idx = np.arange(0, span, 20)  # Annotate every 20th point
+        for i, value in zip(idx.tolist(), total_throughput[idx].tolist()):
+            self.annotations.append(
+                ax3.annotate(f"{int(value)}", (i, value), textcoords="offset points", xytext=(0, 5), ha='center'))
+
+        for ax in (ax1, ax2, ax3):
+            ax.relim()
+            ax.autoscale_view()
+
         # Average Congestion by Road with Detailed Labels
-        avg_congestion = {road.name: np.mean(road.history) * 100 for road in self.roads}
+        ax4.clear()
+        avg_congestion = {road.name: np.mean(histories[road.name]) * 100 for road in self.roads}
         ax4.bar(avg_congestion.keys(), avg_congestion.values())
         for i, (name, value) in enumerate(avg_congestion.items()):
             ax4.text(i, value, f"{value:.2f}%", ha='center', va='bottom')  # Show values on top of bars
         ax4.set_title("Average Congestion by Road")
         ax4.set_ylabel("Average Congestion Level (%)")
 
-        plt.tight_layout()
+        self.fig.tight_layout()
         plt.show()
-        fig.savefig("traffic_simulation_summary.png")
-        plt.close(fig)
+        self.fig.savefig("traffic_simulation_summary.png")
 
     def generate_pdf_report(self):
         """Generate a detailed PDF report with specific performance metrics for each road, including units of measurement and the algorithm used."""
@@ -202,11 +331,15 @@ class TrafficSimulator:
 
         # Detailed metrics for each road
         for road in self.roads:
-            avg_congestion = np.mean(road.history) * 100 if road.history else 0
-            peak_congestion = max(road.history) * 100 if road.history else 0
-            min_congestion = min(road.history) * 100 if road.history else 0
-            high_congestion_periods = sum(1 for x in road.history if x > 0.7)  # High congestion is over 70%
-            total_vehicles = sum([load * road.capacity for load in road.history])
+            # All five metrics come from NumPy reductions over the history
+            # prefix instead of five Python-level passes.
+            history = road.history[:road.t]
+            avg_congestion = history.mean() * 100 if road.t else 0
+            peak_congestion = history.max() * 100 if road.t else 0
+            min_congestion = history.min() * 100 if road.t else 0
+            # float32 threshold keeps the compare in history's own dtype
+            high_congestion_periods = int((history > np.float32(0.7)).sum())  # High congestion is over 70%
+            total_vehicles = float(history.sum()) * road.capacity
 
             c.drawString(100, y_position, f"{road.name} Highway Performance:")
             y_position -= 15
@@ -231,21 +364,79 @@ class TrafficSimulator:
         messagebox.showinfo("Report Saved", f"Simulation report saved as {pdf_file}")
 
 
-def draw_road_layout():
+def _render_cached(font, cache, text):
+    """Render text once and reuse the Surface on later frames."""
+    surface = cache.get(text)
+    if surface is None:
+        surface = cache[text] = font.render(text, True, (255, 255, 255))
+    return surface
+
+
+def draw_road_layout(font, label_cache):
     pygame.draw.line(screen, (255, 255, 255), (100, 300), (700, 300), 5)
     pygame.draw.line(screen, (255, 255, 255), (100, 400), (700, 400), 5)
-    font = pygame.font.Font(None, 36)
-    screen.blit(font.render("Mandela", True, (255, 255, 255)), (10, 280))
-    screen.blit(font.render("Portmore", True, (255, 255, 255)), (10, 380))
+    screen.blit(_render_cached(font, label_cache, "Mandela"), (10, 280))
+    screen.blit(_render_cached(font, label_cache, "Portmore"), (10, 380))
+
+
+def _make_vehicle_sprites():
+    """Prerender one circle Surface per vehicle color for batched blitting."""
+    sprites = []
+    for color in VEHICLE_COLORS:
+        surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (5, 5), 5)
+        sprites.append(surface)
+    return tuple(sprites)
+
+
+def draw_vehicles_on_roads(simulator, roads, congestion_level, sprites):
+    n = len(simulator.vehicles)
+    if n == 0:
+        return
+    # Congestion is fleet-wide, so the adjusted speed is one scalar; the move
+    # becomes a single vectorized add + wrap over the x array.
+    speed = max(1, int(5 * (1 - congestion_level)))  # Slow down in congestion
+    vx = simulator.vx[:n]
+    vx += speed
+    vx[vx > SCREEN_WIDTH] = 0  # Loop back to the start of the road
+    simulator.vspeed[:n] = speed
+    # One blits() call pushes the whole fleet across the Python/SDL boundary
+    # instead of a draw.circle call per vehicle.
+    screen.blits([(sprites[c], (x - 5, y - 5))
+                  for x, y, c in zip(vx.tolist(), simulator.vy[:n].tolist(), simulator.vcolor[:n].tolist())])
+
+
+def run_one(config):
+    """Run one scenario headless and return its per-road summary statistics.
+
+    Touches neither pygame nor tkinter, so it is safe to execute in a worker
+    process."""
+    time_window = config.get("time_window", 24)
+    capacities = config.get("road_capacities", (1000, 800))
+    roads = [
+        Road("Mandela", capacity=capacities[0], coordinates=(18.0116, -76.8102), time_window=time_window),
+        Road("Portmore", capacity=capacities[1], coordinates=(17.9509, -76.8822), time_window=time_window)
+    ]
+    env = simpy.Environment()
+    simulator = TrafficSimulator(env, roads, time_window, config.get("method", "1"),
+                                 config.get("peak_hours", (8, 10)), config.get("vehicle_rate", 20),
+                                 seed=config.get("seed"))
+    env.process(simulator.generate_random_traffic())
+    env.run(until=time_window)
+    return {road.name: {"avg_congestion": float(road.history[:road.t].mean()) if road.t else 0.0,
+                        "peak_congestion": float(road.history[:road.t].max()) if road.t else 0.0}
+            for road in roads}
 
 
-def draw_vehicles_on_roads(vehicles, roads, congestion_level):
-    for vehicle in vehicles:
-        vehicle.move(congestion_level)
-        pygame.draw.circle(screen, vehicle.color, (vehicle.x, vehicle.y), 5)
+def run_batch(configs):
+    """Run independent scenario configs in parallel, one worker per core."""
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        return pool.map(run_one, configs)
 
 
 def run_simulation_with_visualization(roads, time_window=24, method="1", peak_hours=(8, 10), vehicle_rate=20):
+    global screen
+    _init_display()
     env = simpy.Environment()
     simulator = TrafficSimulator(env, roads, time_window, method, peak_hours, vehicle_rate)
     env.process(simulator.generate_random_traffic())
@@ -253,6 +444,18 @@ def run_simulation_with_visualization(roads, time_window=24, method="1", peak_ho
     traffic_light = TrafficLight((SCREEN_WIDTH // 2, 350))  # Place traffic light at midpoint of road
 
     clock = pygame.time.Clock()
+    # One font for the whole run; creating it per frame reloads the FreeType
+    # face 30 times a second. Rendered label surfaces are cached by text.
+    font = pygame.font.Font(None, 36)
+    label_cache = {}
+    sprites = _make_vehicle_sprites()
+    # The road layout is static, so after the first full flip only the regions
+    # that actually change — vehicles (old and new positions), the traffic
+    # light and the load readout — are pushed to the display.
+    light_rect = pygame.Rect(traffic_light.position[0] - 12, traffic_light.position[1] - 12, 24, 24)
+    hud_rect = pygame.Rect(0, 0, SCREEN_WIDTH // 2, 10 + 30 * len(roads) + 20)
+    prev_positions = []
+    first_frame = True
     running = True
     while running and env.peek() <= time_window:
         for event in pygame.event.get():
@@ -260,31 +463,44 @@ def run_simulation_with_visualization(roads, time_window=24, method="1", peak_ho
                 running = False
 
         screen.fill((0, 0, 0))
-        draw_road_layout()
+        draw_road_layout(font, label_cache)
         traffic_light.update()
         traffic_light.draw(screen)
 
         env.step()
-        congestion_level = min(1, sum(road.current_load / road.capacity for road in roads) / len(roads))
-        draw_vehicles_on_roads(simulator.vehicles, roads, congestion_level)
+        # Loads only change on the hourly tick, so the summed ratio is cached
+        # on the simulator instead of re-reduced over the roads every frame.
+        congestion_level = min(1, simulator.total_ratio / len(roads))
+        draw_vehicles_on_roads(simulator, roads, congestion_level, sprites)
 
-        font = pygame.font.Font(None, 36)
         for i, road in enumerate(roads):
-            screen.blit(font.render(f"{road.name} Load: {road.current_load}/{road.capacity}", True, (255, 255, 255)),
+            screen.blit(_render_cached(font, label_cache, f"{road.name} Load: {road.current_load}/{road.capacity}"),
                         (10, 10 + i * 30))
 
-        pygame.display.flip()
+        n = len(simulator.vehicles)
+        positions = list(zip(simulator.vx[:n].tolist(), simulator.vy[:n].tolist()))
+        if first_frame:
+            pygame.display.flip()
+            first_frame = False
+        else:
+            dirty = [pygame.Rect(x - 5, y - 5, 10, 10) for x, y in prev_positions]
+            dirty += [pygame.Rect(x - 5, y - 5, 10, 10) for x, y in positions]
+            dirty.append(light_rect)
+            dirty.append(hud_rect)
+            pygame.display.update(dirty)
+        prev_positions = positions
         clock.tick(30)
 
     pygame.quit()
+    screen = None
     simulator.run_matplotlib_visualization()
     simulator.generate_pdf_report()
 
 
 def start_simulation(selected_method, time_window, peak_hours, vehicle_rate, road_capacities):
     roads = [
-        Road("Mandela", capacity=road_capacities[0], coordinates=(18.0116, -76.8102)),
-        Road("Portmore", capacity=road_capacities[1], coordinates=(17.9509, -76.8822))
+        Road("Mandela", capacity=road_capacities[0], coordinates=(18.0116, -76.8102), time_window=time_window),
+        Road("Portmore", capacity=road_capacities[1], coordinates=(17.9509, -76.8822), time_window=time_window)
     ]
     run_simulation_with_visualization(roads, time_window, selected_method, peak_hours, vehicle_rate)
 
@@ -331,21 +547,48 @@ def create_gui():
     road2_capacity_entry.insert(0, "800")
     road2_capacity_entry.pack(anchor="w", padx=20)
 
-    def on_start():
-        method = selected_method.get()
+    tk.Label(root, text="Batch Runs (number of seeds):").pack(anchor="w", padx=20)
+    batch_runs_entry = tk.Entry(root)
+    batch_runs_entry.insert(0, "8")
+    batch_runs_entry.pack(anchor="w", padx=20)
+
+    def read_parameters():
         time_window = int(time_window_entry.get())
         peak_hours = (6, 8) if peak_period.get() == "morning" else (11.5, 13.5) if peak_period.get() == "midday" else (
         16, 19)
         vehicle_rate = int(vehicle_rate_entry.get())
         road_capacities = [int(road1_capacity_entry.get()), int(road2_capacity_entry.get())]
+        return time_window, peak_hours, vehicle_rate, road_capacities
+
+    def on_start():
+        method = selected_method.get()
+        time_window, peak_hours, vehicle_rate, road_capacities = read_parameters()
 
         root.destroy()
         start_simulation(method, time_window, peak_hours, vehicle_rate, road_capacities)
 
+    def on_batch():
+        method = selected_method.get()
+        time_window, peak_hours, vehicle_rate, road_capacities = read_parameters()
+        num_runs = int(batch_runs_entry.get())
+        configs = [{"method": method, "time_window": time_window, "peak_hours": peak_hours,
+                    "vehicle_rate": vehicle_rate, "road_capacities": road_capacities, "seed": seed}
+                   for seed in range(num_runs)]
+        results = run_batch(configs)
+        lines = [f"Batch of {num_runs} runs:"]
+        for name in results[0]:
+            avg = np.mean([result[name]["avg_congestion"] for result in results]) * 100
+            peak = max(result[name]["peak_congestion"] for result in results) * 100
+            lines.append(f"{name}: average congestion {avg:.2f}%, peak {peak:.2f}%")
+        messagebox.showinfo("Batch Results", "\n".join(lines))
+
     start_button = tk.Button(root, text="Start Simulation", command=on_start)
     start_button.pack(pady=20)
+    batch_button = tk.Button(root, text="Run Batch", command=on_batch)
+    batch_button.pack(pady=5)
 
     root.mainloop()
 
 
-create_gui()
\ No newline at end of file
+if __name__ == "__main__":
+    create_gui()
\ No newline at end of file